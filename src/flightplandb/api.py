@@ -1,12 +1,28 @@
 """These functions return information about the API."""
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from flightplandb import internal
 from flightplandb.datatypes import StatusResponse
 
+# these headers don't change between requests made with the same key,
+# so they only need to be fetched once per key. X-Limit-Cap is not among
+# them, as the limit of a key can be raised at any time.
+_cached_header_keys = ("X-API-Version", "X-Units")
+_header_cache: Dict[Tuple[Optional[str], str], str] = {}
+
+
+def clear_header_cache() -> None:
+    """Forgets all cached header values, so that :meth:`version`
+    and :meth:`units` make a new request on their next call.
+    """
+
+    _header_cache.clear()
+
 
 async def header_value(header_key: str, key: Optional[str] = None) -> str:
     """Gets header value for key. Do not call directly.
+    The values of the API version and units headers are cached per key,
+    see :meth:`clear_header_cache`.
 
     Parameters
     ----------
@@ -21,13 +37,21 @@ async def header_value(header_key: str, key: Optional[str] = None) -> str:
         The value corresponding to the passed key
     """
 
+    if (key, header_key) in _header_cache:
+        return _header_cache[(key, header_key)]
+
     # Make 1 request to fetch headers
     headers = await internal.get_headers(key=key)
+    # and remember every cacheable header it returned, not just this one
+    for cached_key in _cached_header_keys:
+        if cached_key in headers:
+            _header_cache[(key, cached_key)] = headers[cached_key]
     return headers[header_key]
 
 
 async def version(key: Optional[str] = None) -> int:
     """API version that returned the response.
+    The result is cached per key, see :meth:`clear_header_cache`.
 
     Parameters
     ----------
@@ -46,6 +70,7 @@ async def version(key: Optional[str] = None) -> int:
 async def units(key: Optional[str] = None) -> str:
     """The units system used for numeric values.
     https://flightplandatabase.com/dev/api#units
+    The result is cached per key, see :meth:`clear_header_cache`.
 
     Parameters
     ----------
@@ -17,17 +17,31 @@
 # with FlightplanDB-py.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from dateutil.parser import isoparse
 
 
+# search results often repeat the same timestamps, and datetimes are
+# immutable, so parsed timestamps can safely be shared between objects
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    return isoparse(timestamp)
+
+
 def _datetime_to_iso(timestamp: datetime) -> str:
     return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
 
+def _fields_dict(obj: Any) -> Dict[str, Any]:
+    # a shallow copy of the fields, so that to_api_dict never changes the
+    # instance itself; dataclasses with __slots__ have no __dict__ anyway
+    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+
+
 @dataclass
 class StatusResponse:
     """
@@ -45,7 +59,7 @@ class StatusResponse:
     errors: Optional[List[str]]
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -89,12 +103,12 @@ class User:
 
     def __post_init__(self) -> None:
         if self.joined and isinstance(self.joined, str):
-            self.joined = isoparse(self.joined)
+            self.joined = _parse_iso(self.joined)
         if self.lastSeen and isinstance(self.lastSeen, str):
-            self.lastSeen = isoparse(self.lastSeen)
+            self.lastSeen = _parse_iso(self.lastSeen)
 
     def to_api_dict(self) -> Dict[str, Any]:
-        resp_dict = self.__dict__
+        resp_dict = _fields_dict(self)
         if isinstance(resp_dict["joined"], datetime):
             resp_dict["joined"] = _datetime_to_iso(resp_dict["joined"])
         if isinstance(resp_dict["lastSeen"], datetime):
@@ -124,7 +138,7 @@ class UserSmall:
     gravatarHash: Optional[str] = None
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -146,7 +160,7 @@ class Application:
     url: Optional[str] = None
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -173,7 +187,7 @@ class Via:
             raise ValueError(f"{self.type} is not a valid Via type")
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -221,7 +235,7 @@ class RouteNode:
         self.via = Via(**self.via) if isinstance(self.via, dict) else self.via
 
     def to_api_dict(self) -> Dict[str, Any]:
-        resp_dict = self.__dict__
+        resp_dict = _fields_dict(self)
         if resp_dict["via"] and isinstance(resp_dict["via"], Via):
             resp_dict["via"] = resp_dict["via"].to_api_dict()
         return resp_dict
@@ -252,7 +266,7 @@ class Route:
         ]
 
     def to_api_dict(self) -> Dict[str, Any]:
-        resp_dict = self.__dict__
+        resp_dict = _fields_dict(self)
         resp_dict["nodes"] = [node.to_api_dict() for node in resp_dict["nodes"]]
         return resp_dict
 
@@ -273,13 +287,15 @@ class Cycle:
         Cycle release
     """
 
+    __slots__ = ("id", "ident", "year", "release")
+
     id: int
     ident: str
     year: int
     release: int
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -357,10 +373,10 @@ class Plan:
 
     def __post_init__(self) -> None:
         if self.createdAt and isinstance(self.createdAt, str):
-            self.createdAt = isoparse(self.createdAt)
+            self.createdAt = _parse_iso(self.createdAt)
 
         if self.updatedAt and isinstance(self.updatedAt, str):
-            self.updatedAt = isoparse(self.updatedAt)
+            self.updatedAt = _parse_iso(self.updatedAt)
 
         if self.user and isinstance(self.user, dict):
             self.user = User(**self.user)
@@ -375,7 +391,7 @@ class Plan:
             self.cycle = Cycle(**self.cycle)
 
     def to_api_dict(self) -> Dict[str, Any]:
-        plan_dict = self.__dict__
+        plan_dict = _fields_dict(self)
         if isinstance(plan_dict["createdAt"], datetime):
             plan_dict["createdAt"] = _datetime_to_iso(plan_dict["createdAt"])
         if isinstance(plan_dict["updatedAt"], datetime):
@@ -431,7 +447,7 @@ class PlanQuery:
     includeRoute: Optional[bool] = None
 
     def to_api_dict(self) -> Dict[str, Any]:
-        plan_query_dict = self.__dict__
+        plan_query_dict = _fields_dict(self)
         if self.tags:
             plan_query_dict["tags"] = ", ".join(self.tags)
         return plan_query_dict
@@ -483,7 +499,7 @@ class GenerateQuery:
     descentSpeed: Optional[float] = 250
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -508,7 +524,7 @@ class Tag:
     popularity: int
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -524,11 +540,13 @@ class Timezone:
         offset from UTC. Positive is ahead of UTC. ``None`` if not available
     """
 
+    __slots__ = ("name", "offset")
+
     name: Optional[str]
     offset: Optional[float]
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -547,6 +565,8 @@ class Times:
         Time of dusk
     """
 
+    __slots__ = ("sunrise", "sunset", "dawn", "dusk")
+
     sunrise: Union[datetime, str]
     sunset: Union[datetime, str]
     dawn: Union[datetime, str]
@@ -554,16 +574,16 @@ class Times:
 
     def __post_init__(self) -> None:
         self.sunrise = (
-            isoparse(self.sunrise) if isinstance(self.sunrise, str) else self.sunrise
+            _parse_iso(self.sunrise) if isinstance(self.sunrise, str) else self.sunrise
         )
         self.sunset = (
-            isoparse(self.sunset) if isinstance(self.sunset, str) else self.sunset
+            _parse_iso(self.sunset) if isinstance(self.sunset, str) else self.sunset
         )
-        self.dawn = isoparse(self.dawn) if isinstance(self.dawn, str) else self.dawn
-        self.dusk = isoparse(self.dusk) if isinstance(self.dusk, str) else self.dusk
+        self.dawn = _parse_iso(self.dawn) if isinstance(self.dawn, str) else self.dawn
+        self.dusk = _parse_iso(self.dusk) if isinstance(self.dusk, str) else self.dusk
 
     def to_api_dict(self) -> Dict[str, Any]:
-        plan_dict = self.__dict__
+        plan_dict = _fields_dict(self)
         plan_dict["sunrise"] = _datetime_to_iso(plan_dict["sunrise"])
         plan_dict["sunset"] = _datetime_to_iso(plan_dict["sunset"])
         plan_dict["dawn"] = _datetime_to_iso(plan_dict["dawn"])
@@ -585,12 +605,14 @@ class RunwayEnds:
         The longitude of the runway end
     """
 
+    __slots__ = ("ident", "lat", "lon")
+
     ident: str
     lat: float
     lon: float
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -611,7 +633,7 @@ class Navaid:
         The airport associated with the navaid
     runway: str
         The runway associated with the navaid
-    frequency: Optional[float]
+    frequency: Optional[int]
         The navaid frequency in Hz. ``None`` if not available
     slope: Optional[float]
         The navaid slope in degrees from horizontal used for type GS
@@ -633,7 +655,7 @@ class Navaid:
     lon: float
     airport: str
     runway: str
-    frequency: Optional[float]
+    frequency: Optional[int]
     slope: Optional[float]
     bearing: Optional[float]
     name: Optional[str]
@@ -647,7 +669,7 @@ class Navaid:
             raise ValueError(f"{self.type} is not a valid Navaid type")
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -680,6 +702,20 @@ class Runway:
         List of navaids associated with the current runway
     """
 
+    __slots__ = (
+        "ident",
+        "width",
+        "length",
+        "bearing",
+        "surface",
+        "markings",
+        "lighting",
+        "thresholdOffset",
+        "overrunLength",
+        "ends",
+        "navaids",
+    )
+
     ident: str
     width: float
     length: float
@@ -704,7 +740,7 @@ class Runway:
             ]
 
     def to_api_dict(self) -> Dict[str, Any]:
-        resp_dict = self.__dict__
+        resp_dict = _fields_dict(self)
         resp_dict["ends"] = [end.to_api_dict() for end in resp_dict["ends"]]
         resp_dict["navaids"] = [aid.to_api_dict() for aid in resp_dict["navaids"]]
         return resp_dict
@@ -718,19 +754,21 @@ class Frequency:
     ----------
     type : str
         The frequency type
-    frequency : float
+    frequency : int
         The frequency in Hz
     name : Optional[str]
         The frequency name. ``None`` if not available
 
     """
 
+    __slots__ = ("type", "frequency", "name")
+
     type: str
-    frequency: float
+    frequency: int
     name: Optional[str]
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -745,11 +783,13 @@ class Weather:
         Current TAF report for the airport
     """
 
+    __slots__ = ("METAR", "TAF")
+
     METAR: Optional[str]
     TAF: Optional[str]
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
 
 
 @dataclass
@@ -792,6 +832,23 @@ class Airport:
         Airport weather information
     """
 
+    __slots__ = (
+        "ICAO",
+        "IATA",
+        "name",
+        "regionName",
+        "elevation",
+        "lat",
+        "lon",
+        "magneticVariation",
+        "timezone",
+        "times",
+        "runwayCount",
+        "runways",
+        "frequencies",
+        "weather",
+    )
+
     ICAO: str
     IATA: Optional[str]
     name: str
@@ -829,7 +886,7 @@ class Airport:
             self.weather = Weather(**self.weather)
 
     def to_api_dict(self) -> Dict[str, Any]:
-        resp_dict = self.__dict__
+        resp_dict = _fields_dict(self)
         resp_dict["timezone"] = resp_dict["timezone"].to_api_dict()
         resp_dict["times"] = resp_dict["times"].to_api_dict()
         resp_dict["runways"] = [rwy.to_api_dict() for rwy in resp_dict["runways"]]
@@ -856,6 +913,8 @@ class Track:
         UTC datetime the track is valid to
     """
 
+    __slots__ = ("ident", "route", "validFrom", "validTo")
+
     ident: Union[str, int]
     route: Route
     validFrom: datetime
@@ -865,12 +924,12 @@ class Track:
         if self.route and isinstance(self.route, dict):
             self.route = Route(**self.route)
         if self.validFrom and isinstance(self.validFrom, str):
-            self.validFrom = isoparse(self.validFrom)
+            self.validFrom = _parse_iso(self.validFrom)
         if self.validTo and isinstance(self.validTo, str):
-            self.validTo = isoparse(self.validTo)
+            self.validTo = _parse_iso(self.validTo)
 
     def to_api_dict(self) -> Dict[str, Any]:
-        resp_dict = self.__dict__
+        resp_dict = _fields_dict(self)
         if isinstance(resp_dict["validFrom"], datetime):
             resp_dict["validFrom"] = _datetime_to_iso(resp_dict["validFrom"])
         if isinstance(resp_dict["validTo"], datetime):
@@ -921,4 +980,4 @@ class SearchNavaid:
             raise ValueError(f"{self.type} is not a valid SearchNavaid type")
 
     def to_api_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return _fields_dict(self)
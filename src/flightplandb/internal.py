@@ -21,6 +21,7 @@ so you're unlikely to ever use them."""
 
 import json
 from base64 import b64encode
+from copy import deepcopy
 from typing import (
     Any,
     AsyncIterable,
@@ -28,6 +29,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    OrderedDict,
     Tuple,
     Union,
     get_args,
@@ -45,6 +47,40 @@ from flightplandb.exceptions import status_handler
 
 url_base: str = "https://api.flightplandatabase.com"
 
+# Native GET responses which came with an ETag or Last-Modified header, so that
+# repeating the request can be answered by the server with a bodiless 304.
+# Only decoded JSON is cached, since decoding it is what a 304 saves; exports
+# such as PDFs can be large, and would stay in memory for the process's life.
+# Keyed by URL, parameters, Accept, Authorization and return format (as
+# "native" and "json" share an Accept type); the values are
+# (ETag, Last-Modified, response content), least recently used first.
+# Callers only ever get copies of the content, so they can't change the cache.
+response_cache_size: int = 128
+_response_cache: OrderedDict[
+    Tuple[str, str, str, Optional[str], str],
+    Tuple[Optional[str], Optional[str], Any],
+] = OrderedDict()
+
+
+def clear_response_cache() -> None:
+    """Forgets all cached GET responses, so that the next request for each
+    is made unconditionally."""
+
+    _response_cache.clear()
+
+
+def _cache_response(
+    cache_key: Tuple[str, str, str, Optional[str], str],
+    entry: Tuple[Optional[str], Optional[str], Any],
+) -> None:
+    """Stores a response as the most recently used, evicting the least
+    recently used one if the cache is full."""
+
+    _response_cache[cache_key] = entry
+    _response_cache.move_to_end(cache_key)
+    if len(_response_cache) > response_cache_size:
+        _response_cache.popitem(last=False)
+
 
 def _auth_str(key: str) -> str:
     """Returns a API auth string."""
@@ -160,6 +196,9 @@ async def request(
     key: Optional[str] = None,
 ) -> Tuple[CIMultiDictProxy[str], Union[Any, bytes, str]]:
     """General HTTP requests function for non-paginated results.
+    ``"native"`` GET responses which carry an ``ETag`` or ``Last-Modified``
+    header are cached, and repeated as conditional requests;
+    see :meth:`clear_response_cache`.
 
     Parameters
     ----------
@@ -230,25 +269,70 @@ async def request(
     if key is not None:
         request_headers["Authorization"] = _auth_str(key=key)
 
+    url = urljoin(url_base, path)
+
+    # if this GET request was answered before with a validator,
+    # ask the server to only send the content again if it has changed
+    cache_key = None
+    cached = None
+    if method.lower() == "get" and return_format in native_return_values:
+        cache_key = (
+            url,
+            str(sorted(params.items())),
+            request_headers["Accept"],
+            request_headers.get("Authorization"),
+            return_format,
+        )
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag is not None:
+                request_headers["If-None-Match"] = etag
+            if last_modified is not None:
+                request_headers["If-Modified-Since"] = last_modified
+
     async with aiohttp.ClientSession() as session:
         async with session.request(
             method=method,
-            url=urljoin(url_base, path),
+            url=url,
             params=params,
             headers=request_headers,
             json=json_data,
         ) as resp:
+            header = resp.headers
+
+            # the content hasn't changed, so reuse a copy without decoding anything.
+            # The headers are still the new ones, as they contain rate limits.
+            # The entry is stored again rather than moved, since concurrent
+            # requests may have evicted it while this one was in flight.
+            if resp.status == 304 and cache_key is not None and cached is not None:
+                _cache_response(cache_key, cached)
+                return header, deepcopy(cached[2])
+
             status_handler(resp.status, ignore_statuses)
 
-            header = resp.headers
             if return_format in native_return_values:
-                response_content = await resp.json()
+                # JSON is always UTF-8 (RFC 8259). Without this, aiohttp doesn't
+                # recognise the vnd.fpd media type as JSON and guesses the charset
+                response_content = await resp.json(encoding="utf-8")
             # if the format is not a dict
             elif return_format in str_return_values:
                 response_content = await resp.text()
             elif return_format in bytes_return_values:
                 response_content = await resp.read()
 
+            if cache_key is not None and (
+                "ETag" in header or "Last-Modified" in header
+            ):
+                _cache_response(
+                    cache_key,
+                    (
+                        header.get("ETag"),
+                        header.get("Last-Modified"),
+                        deepcopy(response_content),
+                    ),
+                )
+
             return header, response_content
 
 
@@ -625,8 +709,8 @@ async def getiter(
         An iterable of dicts. Return format cannot be specified.
     """
 
-    if not params:
-        params = {}
+    # copy params, since they are changed below and the caller may reuse them
+    params = dict(params) if params else {}
     request_headers = {}
 
     valid_sort_orders = ["created", "updated", "popularity", "distance"]
@@ -682,7 +766,7 @@ async def getiter(
             ) as r_fpdb:
                 status_handler(r_fpdb.status, ignore_statuses)
                 # ...keep cycling through pages...
-                for i in await r_fpdb.json():
+                for i in await r_fpdb.json(encoding="utf-8"):
                     # ...and return every dictionary in there...
                     yield i
                     num_results += 1
@@ -1,5 +1,6 @@
 """Commands related to navigation aids and airports."""
-from typing import AsyncIterable, Dict, List, Optional
+import asyncio
+from typing import AsyncIterable, Dict, Iterable, List, Optional
 
 from flightplandb import internal
 from flightplandb.datatypes import Airport, SearchNavaid, Track
@@ -36,6 +37,48 @@ async def airport(icao: str, key: Optional[str] = None) -> Airport:
         )
 
 
+async def airports(
+    icaos: Iterable[str], max_concurrent: int = 16, key: Optional[str] = None
+) -> List[Airport]:
+    """Fetches information about several airports at once.
+    The requests are made concurrently, rather than one after another,
+    but no more than ``max_concurrent`` of them at a time, to keep
+    within the API's request limits.
+
+    Parameters
+    ----------
+    icaos : Iterable[str]
+        The airport ICAOs to fetch information for
+    max_concurrent : `int`, optional
+        Maximum number of requests in flight at once, defaults to 16
+    key : `str`, optional
+        API authentication key.
+
+    Returns
+    -------
+    List[Airport]
+        :class:`~flightplandb.datatypes.Airport` for each ICAO,
+        in the same order as ``icaos``.
+
+    Raises
+    ------
+    ValueError
+        ``max_concurrent`` is less than 1
+    :class:`~flightplandb.exceptions.BadRequestException`
+        No airport with one of the specified ICAO codes was found.
+    """
+
+    if max_concurrent < 1:
+        raise ValueError("max_concurrent must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def limited_airport(icao: str) -> Airport:
+        async with semaphore:
+            return await airport(icao, key=key)
+
+    return list(await asyncio.gather(*(limited_airport(icao) for icao in icaos)))
+
+
 async def nats(key: Optional[str] = None) -> List[Track]:
     """Fetches current North Atlantic Tracks.
 
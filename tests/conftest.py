@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def async_iter():
+    """Returns a function making an async iterator over items,
+    standing in for internal.getiter."""
+
+    async def make_async_iter(items):
+        for item in items:
+            yield item
+
+    return make_async_iter
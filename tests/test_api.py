@@ -5,18 +5,27 @@ import pytest
 import flightplandb
 from flightplandb.datatypes import StatusResponse
 
+# status response shared by the ping and revoke tests
+OK_JSON = {"message": "OK", "errors": None}
+OK_RESPONSE = StatusResponse(message="OK", errors=None)
+
+
+@pytest.fixture(autouse=True)
+def clear_header_cache():
+    # header values cached by one test must not leak into the next
+    flightplandb.api.clear_header_cache()
+
 
 # parametrise this for key and no key, perhaps
 # localhost is set on every test to allow async loops
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.get_headers")
+@mock.patch(
+    "flightplandb.internal.get_headers",
+    return_value={"X-Limit-Cap": "2000", "X-Limit-Used": "150"},
+)
 async def test_api_header_value(patched_get_headers):
-    json_response = {"X-Limit-Cap": "2000", "X-Limit-Used": "150"}
-
     correct_response = "150"
 
-    patched_get_headers.return_value = json_response
-
     response = await flightplandb.api.header_value(
         header_key="X-Limit-Used", key="qwertyuiop"
     )
@@ -27,96 +36,73 @@ async def test_api_header_value(patched_get_headers):
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.api.header_value")
-async def test_api_version(patched_header_value):
-    header_response = "1"
-
-    correct_response = 1
-
-    patched_header_value.return_value = header_response
-
-    response = await flightplandb.api.version()
-    # check that API method made correct request of FlightPlanDB
-    patched_header_value.assert_awaited_once_with(header_key="X-API-Version", key=None)
-    # check that API method decoded data correctly for given response
-    assert response == correct_response
-
-
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.api.header_value")
-async def test_api_units(patched_header_value):
-    header_response = "AVIATION"
-
-    correct_response = "AVIATION"
-
-    patched_header_value.return_value = header_response
-
-    response = await flightplandb.api.units()
-    # check that API method made correct request of FlightPlanDB
-    patched_header_value.assert_awaited_once_with(header_key="X-Units", key=None)
-    # check that API method decoded data correctly for given response
-    assert response == correct_response
-
-
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.api.header_value")
-async def test_api_limit_cap(patched_header_value):
-    header_response = "100"
-
-    correct_response = 100
-
-    patched_header_value.return_value = header_response
-
-    response = await flightplandb.api.limit_cap()
-    # check that API method made correct request of FlightPlanDB
-    patched_header_value.assert_awaited_once_with(header_key="X-Limit-Cap", key=None)
-    # check that API method decoded data correctly for given response
-    assert response == correct_response
+@mock.patch(
+    "flightplandb.internal.get_headers",
+    return_value={
+        "X-API-Version": "1",
+        "X-Units": "AVIATION",
+        "X-Limit-Cap": "100",
+        "X-Limit-Used": "50",
+    },
+)
+async def test_api_header_value_cache(patched_get_headers):
+    assert await flightplandb.api.version() == 1
+    assert await flightplandb.api.units() == "AVIATION"
+    # check that the static headers were both served from a single request
+    patched_get_headers.assert_awaited_once_with(key=None)
+
+    # check that the request limits are never served from the cache
+    assert await flightplandb.api.limit_cap() == 100
+    assert await flightplandb.api.limit_cap() == 100
+    assert await flightplandb.api.limit_used() == 50
+    assert await flightplandb.api.limit_used() == 50
+    assert patched_get_headers.await_count == 5
+
+    # check that clearing the cache causes a new request
+    flightplandb.api.clear_header_cache()
+    assert await flightplandb.api.version() == 1
+    assert patched_get_headers.await_count == 6
+
+
+# function under test, header key it should request, header value, decoded value
+HEADER_CASES = (
+    (flightplandb.api.version, "X-API-Version", "1", 1),
+    (flightplandb.api.units, "X-Units", "AVIATION", "AVIATION"),
+    (flightplandb.api.limit_cap, "X-Limit-Cap", "100", 100),
+    (flightplandb.api.limit_used, "X-Limit-Used", "50", 50),
+)
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.api.header_value")
-async def test_api_limit_used(patched_header_value):
-    header_response = "50"
-
-    correct_response = 50
-
-    patched_header_value.return_value = header_response
-
-    response = await flightplandb.api.limit_used()
+@pytest.mark.parametrize(
+    "api_function,header_key,header_response,correct_response", HEADER_CASES
+)
+async def test_api_headers(api_function, header_key, header_response, correct_response):
+    with mock.patch(
+        "flightplandb.api.header_value", return_value=header_response
+    ) as patched_header_value:
+        response = await api_function()
     # check that API method made correct request of FlightPlanDB
-    patched_header_value.assert_awaited_once_with(header_key="X-Limit-Used", key=None)
+    patched_header_value.assert_awaited_once_with(header_key=header_key, key=None)
     # check that API method decoded data correctly for given response
     assert response == correct_response
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.get")
+@mock.patch("flightplandb.internal.get", return_value=OK_JSON)
 async def test_api_ping(patched_internal_get):
-    json_response = {"message": "OK", "errors": None}
-
-    correct_response = StatusResponse(message="OK", errors=None)
-
-    patched_internal_get.return_value = json_response
-
     response = await flightplandb.api.ping()
     # check that API method made correct request of FlightPlanDB
     patched_internal_get.assert_awaited_once_with(path="", key=None)
     # check that API method decoded data correctly for given response
-    assert response == correct_response
+    assert response == OK_RESPONSE
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.get")
+@mock.patch("flightplandb.internal.get", return_value=OK_JSON)
 async def test_key_revoke(patched_internal_get):
-    json_response = {"message": "OK", "errors": None}
-
-    correct_response = StatusResponse(message="OK", errors=None)
-
-    patched_internal_get.return_value = json_response
-
     response = await flightplandb.api.revoke(key="qwertyuiop")
     # check that API method made correct request of FlightPlanDB
     patched_internal_get.assert_awaited_once_with(path="/auth/revoke", key="qwertyuiop")
     # check that API method decoded data correctly for given response
-    assert response == correct_response
+    assert response == OK_RESPONSE
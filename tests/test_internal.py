@@ -0,0 +1,208 @@
+from unittest import mock
+
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+
+import flightplandb
+
+
+def make_session(patched_session, *responses):
+    """Makes the patched aiohttp.ClientSession answer successive
+    requests with the given responses, and returns the session."""
+    session = patched_session.return_value.__aenter__.return_value
+    session.request = mock.MagicMock()
+    session.request.return_value.__aenter__.side_effect = responses
+    return session
+
+
+def make_response(status, headers, json_content=None, text_content=None):
+    response = mock.MagicMock()
+    response.status = status
+    response.headers = CIMultiDictProxy(CIMultiDict(headers))
+    response.json = mock.AsyncMock(return_value=json_content)
+    response.text = mock.AsyncMock(return_value=text_content)
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    # responses cached by one test must not leak into the next
+    flightplandb.internal.clear_response_cache()
+
+
+# localhost is set on every test to allow async loops
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@mock.patch("flightplandb.internal.aiohttp.ClientSession")
+async def test_get_not_modified(patched_session):
+    json_response = {"ICAO": "EHAL"}
+
+    first_response = make_response(
+        200, {"ETag": '"abc"', "X-Limit-Used": "1"}, json_response
+    )
+    second_response = make_response(304, {"ETag": '"abc"', "X-Limit-Used": "2"})
+    session = make_session(patched_session, first_response, second_response)
+
+    first = await flightplandb.internal.get(path="/nav/airport/EHAL")
+    second = await flightplandb.internal.get(path="/nav/airport/EHAL")
+
+    # check that the first request was unconditional
+    # and the second one revalidated the cached response
+    first_call, second_call = session.request.call_args_list
+    assert "If-None-Match" not in first_call.kwargs["headers"]
+    assert second_call.kwargs["headers"]["If-None-Match"] == '"abc"'
+    # check that the 304 was answered with the cached content, without decoding
+    assert first == json_response
+    assert second == json_response
+    first_response.json.assert_awaited_once_with(encoding="utf-8")
+    second_response.json.assert_not_awaited()
+
+
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@mock.patch("flightplandb.internal.aiohttp.ClientSession")
+async def test_get_not_modified_copies(patched_session):
+    make_session(
+        patched_session,
+        make_response(200, {"ETag": '"abc"'}, {"ICAO": "EHAL", "runways": []}),
+        make_response(304, {"ETag": '"abc"'}),
+        make_response(304, {"ETag": '"abc"'}),
+    )
+
+    first = await flightplandb.internal.get(path="/nav/airport/EHAL")
+    first["runways"].append({"ident": "05"})
+    second = await flightplandb.internal.get(path="/nav/airport/EHAL")
+    second["ICAO"] = "EHAM"
+    third = await flightplandb.internal.get(path="/nav/airport/EHAL")
+
+    # check that changing a returned response doesn't change the cached one
+    assert second == {"ICAO": "EHAM", "runways": []}
+    assert third == {"ICAO": "EHAL", "runways": []}
+
+
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@mock.patch("flightplandb.internal.aiohttp.ClientSession")
+async def test_get_not_modified_evicted(patched_session):
+    json_response = {"ICAO": "EHAL"}
+
+    first_response = make_response(200, {"ETag": '"abc"'}, json_response)
+    second_response = make_response(304, {"ETag": '"abc"'})
+    third_response = make_response(304, {"ETag": '"abc"'})
+    responses = iter((first_response, second_response, third_response))
+
+    def evict_then_respond():
+        # the cache is emptied while the second request is in flight,
+        # as other concurrent requests might do
+        response = next(responses)
+        if response is second_response:
+            flightplandb.internal.clear_response_cache()
+        return response
+
+    session = make_session(patched_session)
+    session.request.return_value.__aenter__.side_effect = evict_then_respond
+
+    await flightplandb.internal.get(path="/nav/airport/EHAL")
+    second = await flightplandb.internal.get(path="/nav/airport/EHAL")
+
+    # check that the 304 was still answered with the cached content
+    assert second == json_response
+    second_response.json.assert_not_awaited()
+    # check that the content was cached again for the request after that
+    third = await flightplandb.internal.get(path="/nav/airport/EHAL")
+    assert session.request.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+    assert third == json_response
+
+
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@pytest.mark.parametrize("formats", (("native", "json"), ("json", "native")))
+@mock.patch("flightplandb.internal.aiohttp.ClientSession")
+async def test_get_not_modified_formats(patched_session, formats):
+    json_content = {"id": 62373}
+    text_content = '{"id": 62373}'
+    # the server answers the JSON export in full, and revalidates native requests
+    native_responses = iter(
+        (
+            make_response(200, {"ETag": '"abc"'}, json_content),
+            make_response(304, {"ETag": '"abc"'}),
+        )
+    )
+    responses = []
+    for return_format in formats * 2:
+        if return_format == "json":
+            responses.append(
+                make_response(200, {"ETag": '"abc"'}, text_content=text_content)
+            )
+        else:
+            responses.append(next(native_responses))
+    make_session(patched_session, *responses)
+
+    for return_format in formats * 2:
+        response = await flightplandb.internal.get(
+            path="/plan/62373", return_format=return_format
+        )
+        # check that each request got content of its own format back,
+        # even though both formats are requested with the same Accept type
+        if return_format == "json":
+            assert isinstance(response, str)
+            assert response == text_content
+        else:
+            assert isinstance(response, dict)
+            assert response == json_content
+
+
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@mock.patch("flightplandb.internal.aiohttp.ClientSession")
+async def test_get_without_validator(patched_session):
+    session = make_session(
+        patched_session,
+        make_response(200, {}, {"message": "OK", "errors": None}),
+        make_response(200, {}, {"message": "OK", "errors": None}),
+    )
+
+    await flightplandb.internal.get(path="")
+    await flightplandb.internal.get(path="")
+
+    # check that nothing was cached without an ETag or Last-Modified header
+    for call in session.request.call_args_list:
+        assert "If-None-Match" not in call.kwargs["headers"]
+        assert "If-Modified-Since" not in call.kwargs["headers"]
+
+
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@mock.patch("flightplandb.internal.aiohttp.ClientSession")
+async def test_get_export_not_cached(patched_session):
+    session = make_session(
+        patched_session,
+        make_response(200, {"ETag": '"abc"'}, text_content="<plan/>"),
+        make_response(200, {"ETag": '"abc"'}, text_content="<plan/>"),
+    )
+
+    await flightplandb.internal.get(path="/plan/62373", return_format="xml")
+    await flightplandb.internal.get(path="/plan/62373", return_format="xml")
+
+    # check that exports are not cached, even with a validator
+    for call in session.request.call_args_list:
+        assert "If-None-Match" not in call.kwargs["headers"]
+
+
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@mock.patch("flightplandb.internal.aiohttp.ClientSession")
+async def test_getiter_params_unchanged(patched_session):
+    session = patched_session.return_value.__aenter__.return_value
+    session.get = mock.MagicMock()
+    session.get.return_value.__aenter__.side_effect = [
+        make_response(200, {}),
+        make_response(200, {}, [{"id": 1}, {"id": 2}]),
+    ]
+    params = {"q": "EHAM", "tags": None, "includeRoute": False}
+
+    response = flightplandb.internal.getiter(path="/search/plans", params=params)
+
+    assert [i async for i in response] == [{"id": 1}, {"id": 2}]
+    # check that the caller's params were not changed by the request
+    assert params == {"q": "EHAM", "tags": None, "includeRoute": False}
+    # check that the params actually sent were converted for the API
+    assert session.get.call_args.kwargs["params"] == {
+        "q": "EHAM",
+        "includeRoute": "false",
+        "sort": "created",
+        "page": 0,
+    }
@@ -1,4 +1,6 @@
 import datetime
+from copy import deepcopy
+from dataclasses import replace
 from unittest import mock
 
 import pytest
@@ -16,813 +18,674 @@ from flightplandb.datatypes import (
     User,
 )
 
+# expected datetimes, built once rather than inside every test;
+# each of these plans was last updated when it was created
+UTC = tzutc()
+PLAN_3491827_TIME = datetime.datetime(2020, 9, 30, 21, 22, 37, tzinfo=UTC)
+PLAN_1295630_TIME = datetime.datetime(2018, 9, 8, 12, 23, 4, tzinfo=UTC)
+PLAN_4179148_TIME = datetime.datetime(2021, 4, 28, 19, 55, 45, tzinfo=UTC)
+PLAN_4708699_TIME = datetime.datetime(2021, 10, 25, 19, 46, 42, tzinfo=UTC)
+
+# status responses, as returned by the API and as decoded by the library
+OK_JSON = {"message": "OK", "errors": None}
+OK_RESPONSE = StatusResponse(message="OK", errors=None)
+NOT_FOUND_JSON = {"message": "Not Found", "errors": None}
+NOT_FOUND_RESPONSE = StatusResponse(message="Not Found", errors=None)
+
+# the nodes of the EHAM-KJFK route, shared by the create and edit tests
+EHAM_KJFK_NODES_RESPONSE = [
+    {
+        "ident": "EHAM",
+        "type": "APT",
+        "lat": 52.31485,
+        "lon": 4.75812,
+        "alt": 0,
+        "name": "Schiphol",
+        "via": None,
+    },
+    {
+        "ident": "KJFK",
+        "type": "APT",
+        "lat": 40.63990,
+        "lon": -73.77666,
+        "alt": 0,
+        "name": "John F Kennedy Intl",
+        "via": None,
+    },
+]
+
+EHAM_KJFK_NODES = [
+    RouteNode(
+        ident="EHAM",
+        type="APT",
+        lat=52.31485,
+        lon=4.75812,
+        alt=0,
+        name="Schiphol",
+        via=None,
+    ),
+    RouteNode(
+        ident="KJFK",
+        type="APT",
+        lat=40.63990,
+        lon=-73.77666,
+        alt=0,
+        name="John F Kennedy Intl",
+        via=None,
+    ),
+]
+
+# the EHAM-KJFK plan, as returned by the API and as decoded by the library
+EHAM_KJFK_RESPONSE = {
+    "id": None,
+    "fromICAO": "EHAM",
+    "toICAO": "KJFK",
+    "fromName": "Schiphol",
+    "toName": "John F Kennedy Intl",
+    "route": {"nodes": EHAM_KJFK_NODES_RESPONSE},
+}
+
+EHAM_KJFK_PLAN = Plan(
+    id=None,
+    fromICAO="EHAM",
+    toICAO="KJFK",
+    fromName="Schiphol",
+    toName="John F Kennedy Intl",
+    user=None,
+    route=Route(EHAM_KJFK_NODES),
+)
 
-class AsyncIter:
-    def __init__(self, items):
-        self.items = items
 
-    async def __aiter__(self):
-        for item in self.items:
-            yield item
+# plan 62373, as returned by the API and as decoded by the library
+PLAN_RESPONSE = {
+    "id": 62373,
+    "fromICAO": "KLAS",
+    "toICAO": "KLAX",
+    "fromName": "Mc Carran Intl",
+    "toName": "Los Angeles Intl",
+    "flightNumber": None,
+    "distance": 206.39578816273502,
+    "maxAltitude": 18000,
+    "waypoints": 8,
+    "likes": 0,
+    "downloads": 1,
+    "popularity": 1,
+    "notes": "",
+    "encodedPolyline": "aaf{E`|y}T|Ftf@px\\hpe@lnCxw Dbsk@r",
+    "createdAt": "2015-08-04T20:48:08.000Z",
+    "updatedAt": "2015-08-04T20:48:08.000Z",
+    "tags": ["generated"],
+    "user": {
+        "id": 2429,
+        "username": "example",
+        "gravatarHash": "f30b58b998a11b5d417cc2c78df3f764",
+        "location": None,
+    },
+}
+
+PLAN_EXPECTED = Plan(
+    id=62373,
+    fromICAO="KLAS",
+    toICAO="KLAX",
+    fromName="Mc Carran Intl",
+    toName="Los Angeles Intl",
+    flightNumber=None,
+    distance=206.39578816273502,
+    maxAltitude=18000,
+    waypoints=8,
+    likes=0,
+    downloads=1,
+    popularity=1,
+    notes="",
+    encodedPolyline="aaf{E`|y}T|Ftf@px\\hpe@lnCxw Dbsk@r",
+    createdAt="2015-08-04T20:48:08.000Z",
+    updatedAt="2015-08-04T20:48:08.000Z",
+    tags=["generated"],
+    user=User(
+        id=2429,
+        username="example",
+        gravatarHash="f30b58b998a11b5d417cc2c78df3f764",
+        location=None,
+    ),
+)
 
 
-# localhost is set on every test to allow async loops
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.get")
-async def test_plan_fetch(patched_internal_get):
-    json_response = {
-        "id": 62373,
-        "fromICAO": "KLAS",
-        "toICAO": "KLAX",
-        "fromName": "Mc Carran Intl",
-        "toName": "Los Angeles Intl",
+# the EHAM-EHAL search results, as returned by the API and as decoded by the library
+SEARCH_RESPONSE = [
+    {
+        "application": None,
+        "createdAt": "2020-09-30T21:22:37.000Z",
+        "cycle": {"id": 31, "ident": "FPD2009", "release": 9, "year": 20},
+        "distance": 76.676565810015,
+        "downloads": 2,
+        "encodedPolyline": "slg~Haoa\\_fiA{xlAkotC{xcB",
         "flightNumber": None,
-        "distance": 206.39578816273502,
-        "maxAltitude": 18000,
-        "waypoints": 8,
+        "fromICAO": "EHAM",
+        "fromName": "Amsterdam Schiphol",
+        "id": 3491827,
         "likes": 0,
-        "downloads": 1,
-        "popularity": 1,
-        "notes": "",
-        "encodedPolyline": "aaf{E`|y}T|Ftf@px\\hpe@lnCxw Dbsk@r",
-        "createdAt": "2015-08-04T20:48:08.000Z",
-        "updatedAt": "2015-08-04T20:48:08.000Z",
+        "maxAltitude": 9600,
+        "notes": "foo",
+        "popularity": 1601846557,
         "tags": ["generated"],
-        "user": {
-            "id": 2429,
-            "username": "example",
-            "gravatarHash": "f30b58b998a11b5d417cc2c78df3f764",
-            "location": None,
-        },
-    }
+        "toICAO": "EHAL",
+        "toName": "Ameland",
+        "updatedAt": "2020-09-30T21:22:37.000Z",
+        "user": None,
+        "waypoints": 3,
+    },
+    {
+        "application": None,
+        "createdAt": "2018-09-08T12:23:04.000Z",
+        "cycle": {"id": 5, "ident": "FPD1809", "release": 9, "year": 18},
+        "distance": 76.44654421193701,
+        "downloads": 0,
+        "encodedPolyline": "slg~Haoa\\{hlC}|xBolqAytw@",
+        "flightNumber": None,
+        "fromICAO": "EHAM",
+        "fromName": "Amsterdam Schiphol Airport",
+        "id": 1295630,
+        "likes": 0,
+        "maxAltitude": 7700,
+        "notes": "foo",
+        "popularity": 1536409384,
+        "tags": ["generated"],
+        "toICAO": "EHAL",
+        "toName": "Ameland",
+        "updatedAt": "2018-09-08T12:23:04.000Z",
+        "user": None,
+        "waypoints": 3,
+    },
+]
+
+SEARCH_EXPECTED_FIRST = Plan(
+    id=3491827,
+    fromICAO="EHAM",
+    toICAO="EHAL",
+    fromName="Amsterdam Schiphol",
+    toName="Ameland",
+    flightNumber=None,
+    distance=76.676565810015,
+    maxAltitude=9600,
+    waypoints=3,
+    likes=0,
+    downloads=2,
+    popularity=1601846557,
+    notes="foo",
+    encodedPolyline="slg~Haoa\\_fiA{xlAkotC{xcB",
+    createdAt=PLAN_3491827_TIME,
+    updatedAt=PLAN_3491827_TIME,
+    tags=["generated"],
+    user=None,
+    application=None,
+    route=None,
+    cycle=Cycle(id=31, ident="FPD2009", year=20, release=9),
+)
 
-    correct_response = Plan(
-        id=62373,
-        fromICAO="KLAS",
-        toICAO="KLAX",
-        fromName="Mc Carran Intl",
-        toName="Los Angeles Intl",
-        flightNumber=None,
-        distance=206.39578816273502,
-        maxAltitude=18000,
-        waypoints=8,
-        likes=0,
-        downloads=1,
-        popularity=1,
-        notes="",
-        encodedPolyline="aaf{E`|y}T|Ftf@px\\hpe@lnCxw Dbsk@r",
-        createdAt="2015-08-04T20:48:08.000Z",
-        updatedAt="2015-08-04T20:48:08.000Z",
-        tags=["generated"],
-        user=User(
-            id=2429,
-            username="example",
-            gravatarHash="f30b58b998a11b5d417cc2c78df3f764",
-            location=None,
-        ),
-    )
+# the second search result only differs from the first in these fields
+SEARCH_EXPECTED = [
+    SEARCH_EXPECTED_FIRST,
+    replace(
+        SEARCH_EXPECTED_FIRST,
+        id=1295630,
+        fromName="Amsterdam Schiphol Airport",
+        distance=76.44654421193701,
+        maxAltitude=7700,
+        downloads=0,
+        popularity=1536409384,
+        encodedPolyline="slg~Haoa\\{hlC}|xBolqAytw@",
+        createdAt=PLAN_1295630_TIME,
+        updatedAt=PLAN_1295630_TIME,
+        cycle=Cycle(id=5, ident="FPD1809", year=18, release=9),
+    ),
+]
+
+
+# the user who owns generated and decoded plans,
+# as returned by the API and as decoded by the library
+BOT_USER_JSON = {
+    "gravatarHash": "3bcb4f39a24700e081f49c3d2d43d277",
+    "id": 18990,
+    "location": None,
+    "username": "discordflightplannerbot",
+}
+
+BOT_USER = User(
+    id=18990,
+    username="discordflightplannerbot",
+    location=None,
+    gravatarHash="3bcb4f39a24700e081f49c3d2d43d277",
+    joined=None,
+    lastSeen=None,
+    plansCount=0,
+    plansDistance=0.0,
+    plansDownloads=0,
+    plansLikes=0,
+)
 
-    patched_internal_get.return_value = json_response
 
-    response = await flightplandb.plan.fetch(62373)
-    # check that PlanAPI method decoded data correctly for given response
-    assert response == correct_response
-    # check that PlanAPI method made correct request of FlightPlanDB
-    patched_internal_get.assert_awaited_once_with(
-        path="/plan/62373", return_format="native", key=None
-    )
+# the EHAL-EHTX generated plan, as returned by the API and as decoded by the library
+GENERATE_RESPONSE = {
+    "application": None,
+    "createdAt": "2021-04-28T19:55:45.000Z",
+    "cycle": {"id": 38, "ident": "FPD2104", "release": 4, "year": 21},
+    "distance": 36.666306664518004,
+    "downloads": 0,
+    "encodedPolyline": "_dgeIybta@niaA~vdD",
+    "flightNumber": None,
+    "fromICAO": "EHAL",
+    "fromName": "Ameland",
+    "id": 4179148,
+    "likes": 0,
+    "maxAltitude": 0,
+    "notes": "Basic altitude profile:\n"
+    "- Ascent Rate: 2500ft/min\n"
+    "- Ascent Speed: 250kts\n"
+    "- Cruise Altitude: 35000ft\n"
+    "- Cruise Speed: 420kts\n"
+    "- Descent Rate: 1500ft/min\n"
+    "- Descent Speed: 250kts\n"
+    "\n"
+    "Options:\n"
+    "- Use NATs: yes\n"
+    "- Use PACOTS: yes\n"
+    "- Use low airways: yes\n"
+    "- Use high airways: yes\n",
+    "popularity": 1619639745,
+    "tags": ["generated"],
+    "toICAO": "EHTX",
+    "toName": "Texel",
+    "updatedAt": "2021-04-28T19:55:45.000Z",
+    "user": BOT_USER_JSON,
+    "waypoints": 2,
+}
+
+GENERATE_EXPECTED = Plan(
+    id=4179148,
+    fromICAO="EHAL",
+    toICAO="EHTX",
+    fromName="Ameland",
+    toName="Texel",
+    flightNumber=None,
+    distance=36.666306664518004,
+    maxAltitude=0,
+    waypoints=2,
+    likes=0,
+    downloads=0,
+    popularity=1619639745,
+    notes="Basic altitude profile:\n"
+    "- Ascent Rate: 2500ft/min\n"
+    "- Ascent Speed: 250kts\n"
+    "- Cruise Altitude: 35000ft\n"
+    "- Cruise Speed: 420kts\n"
+    "- Descent Rate: 1500ft/min\n"
+    "- Descent Speed: 250kts\n\nOptions:\n"
+    "- Use NATs: yes\n"
+    "- Use PACOTS: yes\n"
+    "- Use low airways: yes\n"
+    "- Use high airways: yes\n",
+    encodedPolyline="_dgeIybta@niaA~vdD",
+    createdAt=PLAN_4179148_TIME,
+    updatedAt=PLAN_4179148_TIME,
+    tags=["generated"],
+    user=BOT_USER,
+    application=None,
+    route=None,
+    cycle=Cycle(id=38, ident="FPD2104", year=21, release=4),
+)
 
 
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.post")
-async def test_plan_create(patched_internal_post):
-    json_response = {
-        "id": None,
-        "fromICAO": "EHAM",
-        "toICAO": "KJFK",
-        "fromName": "Schiphol",
-        "toName": "John F Kennedy Intl",
-        "route": {
-            "nodes": [
-                {
-                    "ident": "EHAM",
-                    "type": "APT",
-                    "lat": 52.31485,
-                    "lon": 4.75812,
-                    "alt": 0,
-                    "name": "Schiphol",
-                    "via": None,
-                },
-                {
-                    "ident": "KJFK",
-                    "type": "APT",
-                    "lat": 40.63990,
-                    "lon": -73.77666,
-                    "alt": 0,
-                    "name": "John F Kennedy Intl",
-                    "via": None,
-                },
-            ]
-        },
-    }
+# the KSAN-KDEN decoded plan, as returned by the API and as decoded by the library
+DECODE_RESPONSE = {
+    "id": 4708699,
+    "fromICAO": "KSAN",
+    "toICAO": "KDEN",
+    "fromName": "San Diego Intl",
+    "toName": "Denver Intl",
+    "flightNumber": None,
+    "distance": 757.3434118878,
+    "maxAltitude": 0,
+    "waypoints": 5,
+    "likes": 0,
+    "downloads": 0,
+    "popularity": 1635191202,
+    "notes": "Requested: KSAN BROWS TRM LRAIN KDEN",
+    "encodedPolyline": "_hxfEntgjUr_S_`qAgvaEocvBsksPgn_a@_~kSwgbc@",
+    "createdAt": "2021-10-25T19:46:42.000Z",
+    "updatedAt": "2021-10-25T19:46:42.000Z",
+    "tags": ["decoded"],
+    "user": BOT_USER_JSON,
+    "application": None,
+    "cycle": {"id": 40, "ident": "FPD2106", "year": 21, "release": 6},
+}
+
+DECODE_EXPECTED = Plan(
+    id=4708699,
+    fromICAO="KSAN",
+    toICAO="KDEN",
+    fromName="San Diego Intl",
+    toName="Denver Intl",
+    flightNumber=None,
+    distance=757.3434118878,
+    maxAltitude=0,
+    waypoints=5,
+    likes=0,
+    downloads=0,
+    popularity=1635191202,
+    notes="Requested: KSAN BROWS TRM LRAIN KDEN",
+    encodedPolyline="_hxfEntgjUr_S_`qAgvaEocvBsksPgn_a@_~kSwgbc@",
+    createdAt=PLAN_4708699_TIME,
+    updatedAt=PLAN_4708699_TIME,
+    tags=["decoded"],
+    user=BOT_USER,
+    application=None,
+    route=None,
+    cycle=Cycle(id=40, ident="FPD2106", year=21, release=6),
+)
 
-    correct_response = Plan(
-        id=None,
-        fromICAO="EHAM",
-        toICAO="KJFK",
-        fromName="Schiphol",
-        toName="John F Kennedy Intl",
-        user=None,
-        route=Route(
-            [
-                RouteNode(
-                    **{
-                        "ident": "EHAM",
-                        "type": "APT",
-                        "lat": 52.31485,
-                        "lon": 4.75812,
-                        "alt": 0,
-                        "name": "Schiphol",
-                        "via": None,
-                    }
-                ),
-                RouteNode(
-                    **{
-                        "ident": "KJFK",
-                        "type": "APT",
-                        "lat": 40.63990,
-                        "lon": -73.77666,
-                        "alt": 0,
-                        "name": "John F Kennedy Intl",
-                        "via": None,
-                    }
-                ),
-            ]
-        ),
-    )
 
-    request_data = Plan(
-        id=None,
-        fromICAO="EHAM",
-        toICAO="KJFK",
-        fromName="Schiphol",
-        toName="John F Kennedy Intl",
-        user=None,
-        route=Route(
-            [
-                RouteNode(
-                    **{
-                        "ident": "EHAM",
-                        "type": "APT",
-                        "lat": 52.31485,
-                        "lon": 4.75812,
-                        "alt": 0,
-                        "name": "Schiphol",
-                        "via": None,
-                    }
-                ),
-                RouteNode(
-                    **{
-                        "ident": "KJFK",
-                        "type": "APT",
-                        "lat": 40.63990,
-                        "lon": -73.77666,
-                        "alt": 0,
-                        "name": "John F Kennedy Intl",
-                        "via": None,
-                    }
-                ),
-            ]
-        ),
-    )
-    correct_call = {
-        "path": "/plan/",
-        "json_data": {
-            "id": None,
-            "fromICAO": "EHAM",
-            "toICAO": "KJFK",
-            "fromName": "Schiphol",
-            "toName": "John F Kennedy Intl",
-            "flightNumber": None,
-            "distance": None,
-            "maxAltitude": None,
-            "waypoints": None,
-            "likes": None,
-            "downloads": None,
-            "popularity": None,
-            "notes": None,
-            "encodedPolyline": None,
-            "createdAt": None,
-            "updatedAt": None,
-            "tags": None,
-            "user": None,
-            "application": None,
-            "route": {
-                "nodes": [
-                    {
-                        "ident": "EHAM",
-                        "type": "APT",
-                        "lat": 52.31485,
-                        "lon": 4.75812,
-                        "id": None,
-                        "alt": 0,
-                        "name": "Schiphol",
-                        "via": None,
-                    },
-                    {
-                        "ident": "KJFK",
-                        "type": "APT",
-                        "lat": 40.6399,
-                        "lon": -73.77666,
-                        "id": None,
-                        "alt": 0,
-                        "name": "John F Kennedy Intl",
-                        "via": None,
-                    },
-                ],
-                "eastLevels": None,
-                "westLevels": None,
+# the request bodies expected when creating and editing the EHAM-KJFK plan,
+# which only differ in the id
+CREATE_JSON = {
+    "id": None,
+    "fromICAO": "EHAM",
+    "toICAO": "KJFK",
+    "fromName": "Schiphol",
+    "toName": "John F Kennedy Intl",
+    "flightNumber": None,
+    "distance": None,
+    "maxAltitude": None,
+    "waypoints": None,
+    "likes": None,
+    "downloads": None,
+    "popularity": None,
+    "notes": None,
+    "encodedPolyline": None,
+    "createdAt": None,
+    "updatedAt": None,
+    "tags": None,
+    "user": None,
+    "application": None,
+    "route": {
+        "nodes": [
+            {
+                "ident": "EHAM",
+                "type": "APT",
+                "lat": 52.31485,
+                "lon": 4.75812,
+                "id": None,
+                "alt": 0,
+                "name": "Schiphol",
+                "via": None,
+            },
+            {
+                "ident": "KJFK",
+                "type": "APT",
+                "lat": 40.6399,
+                "lon": -73.77666,
+                "id": None,
+                "alt": 0,
+                "name": "John F Kennedy Intl",
+                "via": None,
             },
-            "cycle": None,
+        ],
+        "eastLevels": None,
+        "westLevels": None,
+    },
+    "cycle": None,
+}
+
+EDIT_JSON = {**CREATE_JSON, "id": 23896}
+
+# the request bodies expected when generating and decoding a plan
+GENERATE_JSON = {
+    "fromICAO": "EHAL",
+    "toICAO": "EHTX",
+    "useNAT": True,
+    "usePACOT": True,
+    "useAWYLO": True,
+    "useAWYHI": True,
+    "cruiseAlt": 35000,
+    "cruiseSpeed": 420,
+    "ascentRate": 2500,
+    "ascentSpeed": 250,
+    "descentRate": 1500,
+    "descentSpeed": 250,
+    "includeRoute": "false",
+}
+
+DECODE_JSON = {"route": "KSAN BROWS TRM LRAIN KDEN"}
+
+
+UPLOAD_CASES = (
+    (
+        flightplandb.plan.create,
+        "flightplandb.internal.post",
+        EHAM_KJFK_PLAN,
+        EHAM_KJFK_RESPONSE,
+        {
+            "path": "/plan/",
+            "json_data": CREATE_JSON,
+            "return_format": "native",
+            "key": None,
         },
-        "return_format": "native",
-        "key": None,
-    }
+    ),
+    (
+        flightplandb.plan.edit,
+        "flightplandb.internal.patch",
+        replace(EHAM_KJFK_PLAN, id=23896),
+        {**EHAM_KJFK_RESPONSE, "id": 23896},
+        {
+            "path": "/plan/23896",
+            "json_data": EDIT_JSON,
+            "return_format": "native",
+            "key": None,
+        },
+    ),
+)
 
-    patched_internal_post.return_value = json_response
 
-    response = await flightplandb.plan.create(request_data)
+# localhost is set on every test to allow async loops
+@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
+@pytest.mark.parametrize(
+    "plan_function,internal_function,request_data,json_response,correct_call",
+    UPLOAD_CASES,
+)
+async def test_plan_upload(
+    plan_function, internal_function, request_data, json_response, correct_call
+):
+    with mock.patch(
+        internal_function, return_value=json_response
+    ) as patched_internal_function:
+        response = await plan_function(request_data)
     # check that PlanAPI method decoded data correctly for given response
-    assert response == correct_response
+    assert response == request_data
     # check that PlanAPI method made correct request of FlightPlanDB
-    patched_internal_post.assert_awaited_once_with(**correct_call)
+    patched_internal_function.assert_awaited_once_with(**correct_call)
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.delete")
-async def test_plan_delete(patched_internal_delete):
-    json_response = {"message": "OK", "errors": None}
-
-    correct_response = StatusResponse(message="OK", errors=None)
-
-    patched_internal_delete.return_value = json_response
-
-    response = await flightplandb.plan.delete(62493)
-    # check that TagsAPI method made correct request of FlightPlanDB
-    patched_internal_delete.assert_awaited_once_with(path="/plan/62493", key=None)
-    # check that TagsAPI method decoded data correctly for given response
-    assert response == correct_response
-
-
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.patch")
-async def test_plan_edit(patched_internal_patch):
-    json_response = {
-        "id": 23896,
-        "fromICAO": "EHAM",
-        "toICAO": "KJFK",
-        "fromName": "Schiphol",
-        "toName": "John F Kennedy Intl",
-        "route": {
-            "nodes": [
-                {
-                    "ident": "EHAM",
-                    "type": "APT",
-                    "lat": 52.31485,
-                    "lon": 4.75812,
-                    "alt": 0,
-                    "name": "Schiphol",
-                    "via": None,
-                },
-                {
-                    "ident": "KJFK",
-                    "type": "APT",
-                    "lat": 40.63990,
-                    "lon": -73.77666,
-                    "alt": 0,
-                    "name": "John F Kennedy Intl",
-                    "via": None,
-                },
-            ]
-        },
-    }
-
-    correct_response = Plan(
-        id=23896,
-        fromICAO="EHAM",
-        toICAO="KJFK",
-        fromName="Schiphol",
-        toName="John F Kennedy Intl",
-        user=None,
-        route=Route(
-            [
-                RouteNode(
-                    **{
-                        "ident": "EHAM",
-                        "type": "APT",
-                        "lat": 52.31485,
-                        "lon": 4.75812,
-                        "alt": 0,
-                        "name": "Schiphol",
-                        "via": None,
-                    }
-                ),
-                RouteNode(
-                    **{
-                        "ident": "KJFK",
-                        "type": "APT",
-                        "lat": 40.63990,
-                        "lon": -73.77666,
-                        "alt": 0,
-                        "name": "John F Kennedy Intl",
-                        "via": None,
-                    }
-                ),
-            ]
-        ),
-    )
-
-    request_data = Plan(
-        id=23896,
-        fromICAO="EHAM",
-        toICAO="KJFK",
-        fromName="Schiphol",
-        toName="John F Kennedy Intl",
-        user=None,
-        route=Route(
-            [
-                RouteNode(
-                    **{
-                        "ident": "EHAM",
-                        "type": "APT",
-                        "lat": 52.31485,
-                        "lon": 4.75812,
-                        "alt": 0,
-                        "name": "Schiphol",
-                        "via": None,
-                    }
-                ),
-                RouteNode(
-                    **{
-                        "ident": "KJFK",
-                        "type": "APT",
-                        "lat": 40.63990,
-                        "lon": -73.77666,
-                        "alt": 0,
-                        "name": "John F Kennedy Intl",
-                        "via": None,
-                    }
-                ),
-            ]
-        ),
-    )
-    correct_call = {
-        "path": "/plan/23896",
-        "json_data": {
-            "id": 23896,
-            "fromICAO": "EHAM",
-            "toICAO": "KJFK",
-            "fromName": "Schiphol",
-            "toName": "John F Kennedy Intl",
-            "flightNumber": None,
-            "distance": None,
-            "maxAltitude": None,
-            "waypoints": None,
-            "likes": None,
-            "downloads": None,
-            "popularity": None,
-            "notes": None,
-            "encodedPolyline": None,
-            "createdAt": None,
-            "updatedAt": None,
-            "tags": None,
-            "user": None,
-            "application": None,
-            "route": {
-                "nodes": [
-                    {
-                        "ident": "EHAM",
-                        "type": "APT",
-                        "lat": 52.31485,
-                        "lon": 4.75812,
-                        "id": None,
-                        "alt": 0,
-                        "name": "Schiphol",
-                        "via": None,
-                    },
-                    {
-                        "ident": "KJFK",
-                        "type": "APT",
-                        "lat": 40.6399,
-                        "lon": -73.77666,
-                        "id": None,
-                        "alt": 0,
-                        "name": "John F Kennedy Intl",
-                        "via": None,
-                    },
-                ],
-                "eastLevels": None,
-                "westLevels": None,
-            },
-            "cycle": None,
-        },
-        "return_format": "native",
-        "key": None,
-    }
+@mock.patch("flightplandb.internal.getiter")
+async def test_plan_search(patched_internal_getiter, async_iter):
+    patched_internal_getiter.return_value = async_iter(SEARCH_RESPONSE)
 
-    patched_internal_patch.return_value = json_response
+    request_data = PlanQuery(fromICAO="EHAM", toICAO="EHAL")
 
-    response = await flightplandb.plan.edit(
-        plan=request_data, return_format="native", key=None
-    )
+    response = flightplandb.plan.search(request_data, limit=2)
     # check that PlanAPI method decoded data correctly for given response
-    assert response == correct_response
+    assert [i async for i in response] == SEARCH_EXPECTED
+    # check that PlanAPI method left the query itself unchanged
+    assert request_data == PlanQuery(fromICAO="EHAM", toICAO="EHAL")
     # check that PlanAPI method made correct request of FlightPlanDB
-    patched_internal_patch.assert_called_once_with(**correct_call)
-
-
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.getiter")
-async def test_plan_search(patched_internal_getiter):
-    json_response = [
-        {
-            "application": None,
-            "createdAt": "2020-09-30T21:22:37.000Z",
-            "cycle": {"id": 31, "ident": "FPD2009", "release": 9, "year": 20},
-            "distance": 76.676565810015,
-            "downloads": 2,
-            "encodedPolyline": "slg~Haoa\\_fiA{xlAkotC{xcB",
-            "flightNumber": None,
+    patched_internal_getiter.assert_called_once_with(
+        path="/search/plans",
+        sort="created",
+        params={
+            "q": None,
+            "From": None,
+            "to": None,
             "fromICAO": "EHAM",
-            "fromName": "Amsterdam Schiphol",
-            "id": 3491827,
-            "likes": 0,
-            "maxAltitude": 9600,
-            "notes": "foo",
-            "popularity": 1601846557,
-            "tags": ["generated"],
             "toICAO": "EHAL",
-            "toName": "Ameland",
-            "updatedAt": "2020-09-30T21:22:37.000Z",
-            "user": None,
-            "waypoints": 3,
-        },
-        {
-            "application": None,
-            "createdAt": "2018-09-08T12:23:04.000Z",
-            "cycle": {"id": 5, "ident": "FPD1809", "release": 9, "year": 18},
-            "distance": 76.44654421193701,
-            "downloads": 0,
-            "encodedPolyline": "slg~Haoa\\{hlC}|xBolqAytw@",
+            "fromName": None,
+            "toName": None,
             "flightNumber": None,
-            "fromICAO": "EHAM",
-            "fromName": "Amsterdam Schiphol Airport",
-            "id": 1295630,
-            "likes": 0,
-            "maxAltitude": 7700,
-            "notes": "foo",
-            "popularity": 1536409384,
-            "tags": ["generated"],
-            "toICAO": "EHAL",
-            "toName": "Ameland",
-            "updatedAt": "2018-09-08T12:23:04.000Z",
-            "user": None,
-            "waypoints": 3,
+            "distanceMin": None,
+            "distanceMax": None,
+            "tags": None,
+            "includeRoute": False,
         },
-    ]
-
-    correct_response_list = [
-        Plan(
-            id=3491827,
-            fromICAO="EHAM",
-            toICAO="EHAL",
-            fromName="Amsterdam Schiphol",
-            toName="Ameland",
-            flightNumber=None,
-            distance=76.676565810015,
-            maxAltitude=9600,
-            waypoints=3,
-            likes=0,
-            downloads=2,
-            popularity=1601846557,
-            notes="foo",
-            encodedPolyline="slg~Haoa\\_fiA{xlAkotC{xcB",
-            createdAt=datetime.datetime(2020, 9, 30, 21, 22, 37, tzinfo=tzutc()),
-            updatedAt=datetime.datetime(2020, 9, 30, 21, 22, 37, tzinfo=tzutc()),
-            tags=["generated"],
-            user=None,
-            application=None,
-            route=None,
-            cycle=Cycle(id=31, ident="FPD2009", year=20, release=9),
-        ),
-        Plan(
-            id=1295630,
-            fromICAO="EHAM",
-            toICAO="EHAL",
-            fromName="Amsterdam Schiphol Airport",
-            toName="Ameland",
-            flightNumber=None,
-            distance=76.44654421193701,
-            maxAltitude=7700,
-            waypoints=3,
-            likes=0,
-            downloads=0,
-            popularity=1536409384,
-            notes="foo",
-            encodedPolyline="slg~Haoa\\{hlC}|xBolqAytw@",
-            createdAt=datetime.datetime(2018, 9, 8, 12, 23, 4, tzinfo=tzutc()),
-            updatedAt=datetime.datetime(2018, 9, 8, 12, 23, 4, tzinfo=tzutc()),
-            tags=["generated"],
-            user=None,
-            application=None,
-            route=None,
-            cycle=Cycle(id=5, ident="FPD1809", year=18, release=9),
-        ),
-    ]
-    correct_calls = [
-        mock.call(
-            path="/search/plans",
-            sort="created",
-            params={
-                "q": None,
-                "From": None,
-                "to": None,
-                "fromICAO": "EHAM",
-                "toICAO": "EHAL",
-                "fromName": None,
-                "toName": None,
-                "flightNumber": None,
-                "distanceMin": None,
-                "distanceMax": None,
-                "tags": None,
-                "includeRoute": False,
-            },
-            limit=2,
-            key=None,
-        )
-    ]
-
-    patched_internal_getiter.return_value = AsyncIter(json_response)
-
-    response = flightplandb.plan.search(
-        PlanQuery(fromICAO="EHAM", toICAO="EHAL"), limit=2
+        limit=2,
+        key=None,
     )
-    # check that PlanAPI method decoded data correctly for given response
-    response_list = []
-    async for i in response:
-        response_list.append(i)
-    assert response_list == correct_response_list
-    # check that PlanAPI method made correct request of FlightPlanDB
-    patched_internal_getiter.assert_has_calls(correct_calls)
 
 
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.post")
-async def test_plan_like(patched_internal_post):
-    json_response = {"message": "Not Found", "errors": None}
-
-    correct_response = StatusResponse(message="Not Found", errors=None)
-
-    patched_internal_post.return_value = json_response
-
-    response = await flightplandb.plan.like(42)
-    # check that TagsAPI method made correct request of FlightPlanDB
-    patched_internal_post.assert_awaited_once_with(path="/plan/42/like", key=None)
-    # check that TagsAPI method decoded data correctly for given response
-    assert response == correct_response
-
-
-@pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.delete")
-async def test_plan_unlike(patched_internal_delete):
-    json_response = {"message": "OK", "errors": None}
-
-    correct_response = True
-
-    patched_internal_delete.return_value = json_response
-
-    response = await flightplandb.plan.unlike(42)
-    # check that TagsAPI method made correct request of FlightPlanDB
-    patched_internal_delete.assert_awaited_once_with(path="/plan/42/like", key=None)
-    # check that TagsAPI method decoded data correctly for given response
-    assert response == correct_response
+ID_CASES = (
+    (
+        flightplandb.plan.fetch,
+        62373,
+        "flightplandb.internal.get",
+        PLAN_RESPONSE,
+        {"path": "/plan/62373", "return_format": "native", "key": None},
+        PLAN_EXPECTED,
+    ),
+    (
+        flightplandb.plan.delete,
+        62493,
+        "flightplandb.internal.delete",
+        OK_JSON,
+        {"path": "/plan/62493", "key": None},
+        OK_RESPONSE,
+    ),
+    (
+        flightplandb.plan.like,
+        42,
+        "flightplandb.internal.post",
+        NOT_FOUND_JSON,
+        {"path": "/plan/42/like", "key": None},
+        NOT_FOUND_RESPONSE,
+    ),
+    (
+        flightplandb.plan.unlike,
+        42,
+        "flightplandb.internal.delete",
+        OK_JSON,
+        {"path": "/plan/42/like", "key": None},
+        True,
+    ),
+    (
+        flightplandb.plan.has_liked,
+        42,
+        "flightplandb.internal.get",
+        OK_JSON,
+        {"path": "/plan/42/like", "ignore_statuses": (404,), "key": None},
+        True,
+    ),
+)
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
-@mock.patch("flightplandb.internal.get")
-async def test_plan_has_liked(patched_internal_get):
-    json_response = {"message": "OK", "errors": None}
-
-    correct_response = True
-
-    patched_internal_get.return_value = json_response
-
-    response = await flightplandb.plan.has_liked(42)
-    # check that TagsAPI method made correct request of FlightPlanDB
-    patched_internal_get.assert_awaited_once_with(
-        path="/plan/42/like", ignore_statuses=(404,), key=None
-    )
-    # check that TagsAPI method decoded data correctly for given response
+@pytest.mark.parametrize(
+    "plan_function,id_,internal_function,json_response,correct_call,correct_response",
+    ID_CASES,
+)
+async def test_plan_by_id(
+    plan_function, id_, internal_function, json_response, correct_call, correct_response
+):
+    with mock.patch(
+        internal_function, return_value=json_response
+    ) as patched_internal_function:
+        response = await plan_function(id_)
+    # check that PlanAPI method made correct request of FlightPlanDB
+    patched_internal_function.assert_awaited_once_with(**correct_call)
+    # check that PlanAPI method decoded data correctly for given response
     assert response == correct_response
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
 @mock.patch("flightplandb.internal.post")
 async def test_plan_generate(patched_internal_post):
-    json_response = {
-        "application": None,
-        "createdAt": "2021-04-28T19:55:45.000Z",
-        "cycle": {"id": 38, "ident": "FPD2104", "release": 4, "year": 21},
-        "distance": 36.666306664518004,
-        "downloads": 0,
-        "encodedPolyline": "_dgeIybta@niaA~vdD",
-        "flightNumber": None,
-        "fromICAO": "EHAL",
-        "fromName": "Ameland",
-        "id": 4179148,
-        "likes": 0,
-        "maxAltitude": 0,
-        "notes": "Basic altitude profile:\n"
-        "- Ascent Rate: 2500ft/min\n"
-        "- Ascent Speed: 250kts\n"
-        "- Cruise Altitude: 35000ft\n"
-        "- Cruise Speed: 420kts\n"
-        "- Descent Rate: 1500ft/min\n"
-        "- Descent Speed: 250kts\n"
-        "\n"
-        "Options:\n"
-        "- Use NATs: yes\n"
-        "- Use PACOTS: yes\n"
-        "- Use low airways: yes\n"
-        "- Use high airways: yes\n",
-        "popularity": 1619639745,
-        "tags": ["generated"],
-        "toICAO": "EHTX",
-        "toName": "Texel",
-        "updatedAt": "2021-04-28T19:55:45.000Z",
-        "user": {
-            "gravatarHash": "3bcb4f39a24700e081f49c3d2d43d277",
-            "id": 18990,
-            "location": None,
-            "username": "discordflightplannerbot",
-        },
-        "waypoints": 2,
-    }
+    patched_internal_post.return_value = GENERATE_RESPONSE
 
     request_data = GenerateQuery(fromICAO="EHAL", toICAO="EHTX")
 
-    correct_response = Plan(
-        id=4179148,
-        fromICAO="EHAL",
-        toICAO="EHTX",
-        fromName="Ameland",
-        toName="Texel",
-        flightNumber=None,
-        distance=36.666306664518004,
-        maxAltitude=0,
-        waypoints=2,
-        likes=0,
-        downloads=0,
-        popularity=1619639745,
-        notes="Basic altitude profile:\n"
-        "- Ascent Rate: 2500ft/min\n"
-        "- Ascent Speed: 250kts\n"
-        "- Cruise Altitude: 35000ft\n"
-        "- Cruise Speed: 420kts\n"
-        "- Descent Rate: 1500ft/min\n"
-        "- Descent Speed: 250kts\n\nOptions:\n"
-        "- Use NATs: yes\n"
-        "- Use PACOTS: yes\n"
-        "- Use low airways: yes\n"
-        "- Use high airways: yes\n",
-        encodedPolyline="_dgeIybta@niaA~vdD",
-        createdAt=datetime.datetime(2021, 4, 28, 19, 55, 45, tzinfo=tzutc()),
-        updatedAt=datetime.datetime(2021, 4, 28, 19, 55, 45, tzinfo=tzutc()),
-        tags=["generated"],
-        user=User(
-            id=18990,
-            username="discordflightplannerbot",
-            location=None,
-            gravatarHash="3bcb4f39a24700e081f49c3d2d43d277",
-            joined=None,
-            lastSeen=None,
-            plansCount=0,
-            plansDistance=0.0,
-            plansDownloads=0,
-            plansLikes=0,
-        ),
-        application=None,
-        route=None,
-        cycle=Cycle(id=38, ident="FPD2104", year=21, release=4),
-    )
-
-    correct_call = {
-        "path": "/auto/generate",
-        "json_data": {
-            "fromICAO": "EHAL",
-            "toICAO": "EHTX",
-            "useNAT": True,
-            "usePACOT": True,
-            "useAWYLO": True,
-            "useAWYHI": True,
-            "cruiseAlt": 35000,
-            "cruiseSpeed": 420,
-            "ascentRate": 2500,
-            "ascentSpeed": 250,
-            "descentRate": 1500,
-            "descentSpeed": 250,
-            "includeRoute": "false",
-        },
-        "key": None,
-    }
-
-    patched_internal_post.return_value = json_response
-
     response = await flightplandb.plan.generate(request_data)
     # check that PlanAPI method decoded data correctly for given response
-    assert response == correct_response
+    assert response == GENERATE_EXPECTED
+    # check that PlanAPI method left the query itself unchanged
+    assert vars(request_data) == vars(GenerateQuery(fromICAO="EHAL", toICAO="EHTX"))
     # check that PlanAPI method made correct request of FlightPlanDB
-    patched_internal_post.assert_awaited_once_with(**correct_call)
+    patched_internal_post.assert_awaited_once_with(
+        path="/auto/generate", json_data=GENERATE_JSON, key=None
+    )
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
 @mock.patch("flightplandb.internal.post")
 async def test_plan_decode(patched_internal_post):
-    json_response = {
-        "id": 4708699,
-        "fromICAO": "KSAN",
-        "toICAO": "KDEN",
-        "fromName": "San Diego Intl",
-        "toName": "Denver Intl",
-        "flightNumber": None,
-        "distance": 757.3434118878,
-        "maxAltitude": 0,
-        "waypoints": 5,
-        "likes": 0,
-        "downloads": 0,
-        "popularity": 1635191202,
-        "notes": "Requested: KSAN BROWS TRM LRAIN KDEN",
-        "encodedPolyline": "_hxfEntgjUr_S_`qAgvaEocvBsksPgn_a@_~kSwgbc@",
-        "createdAt": "2021-10-25T19:46:42.000Z",
-        "updatedAt": "2021-10-25T19:46:42.000Z",
-        "tags": ["decoded"],
-        "user": {
-            "gravatarHash": "3bcb4f39a24700e081f49c3d2d43d277",
-            "id": 18990,
-            "location": None,
-            "username": "discordflightplannerbot",
-        },
-        "application": None,
-        "cycle": {"id": 40, "ident": "FPD2106", "year": 21, "release": 6},
-    }
+    patched_internal_post.return_value = DECODE_RESPONSE
 
-    request_data = {"KSAN BROWS TRM LRAIN KDEN"}
-
-    correct_response = Plan(
-        id=4708699,
-        fromICAO="KSAN",
-        toICAO="KDEN",
-        fromName="San Diego Intl",
-        toName="Denver Intl",
-        flightNumber=None,
-        distance=757.3434118878,
-        maxAltitude=0,
-        waypoints=5,
-        likes=0,
-        downloads=0,
-        popularity=1635191202,
-        notes="Requested: KSAN BROWS TRM LRAIN KDEN",
-        encodedPolyline="_hxfEntgjUr_S_`qAgvaEocvBsksPgn_a@_~kSwgbc@",
-        createdAt=datetime.datetime(2021, 10, 25, 19, 46, 42, tzinfo=tzutc()),
-        updatedAt=datetime.datetime(2021, 10, 25, 19, 46, 42, tzinfo=tzutc()),
-        tags=["decoded"],
-        user=User(
-            id=18990,
-            username="discordflightplannerbot",
-            location=None,
-            gravatarHash="3bcb4f39a24700e081f49c3d2d43d277",
-            joined=None,
-            lastSeen=None,
-            plansCount=0,
-            plansDistance=0.0,
-            plansDownloads=0,
-            plansLikes=0,
-        ),
-        application=None,
-        route=None,
-        cycle=Cycle(id=40, ident="FPD2106", year=21, release=6),
-    )
-
-    correct_call = {
-        "path": "/auto/decode",
-        "json_data": {"route": {"KSAN BROWS TRM LRAIN KDEN"}},
-        "key": None,
-    }
-
-    patched_internal_post.return_value = json_response
+    request_data = "KSAN BROWS TRM LRAIN KDEN"
 
     response = await flightplandb.plan.decode(request_data)
     # check that PlanAPI method decoded data correctly for given response
-    assert response == correct_response
+    assert response == DECODE_EXPECTED
     # check that PlanAPI method made correct request of FlightPlanDB
-    patched_internal_post.assert_awaited_once_with(**correct_call)
+    patched_internal_post.assert_awaited_once_with(
+        path="/auto/decode", json_data=DECODE_JSON, key=None
+    )
+
+
+def test_plan_to_api_dict_unchanged():
+    plan = Plan(
+        id=23896,
+        fromICAO="EHAM",
+        toICAO="KJFK",
+        fromName="Schiphol",
+        toName="John F Kennedy Intl",
+        createdAt="2021-04-28T19:55:45.000Z",
+        updatedAt="2021-04-28T19:55:45.000Z",
+        user={
+            "id": 18990,
+            "username": "discordflightplannerbot",
+            "joined": "2019-02-27T21:16:08.000Z",
+            "lastSeen": "2021-04-28T19:55:45.000Z",
+        },
+        route={
+            "nodes": [
+                {
+                    "ident": "EHAM",
+                    "type": "APT",
+                    "lat": 52.31485,
+                    "lon": 4.75812,
+                    "alt": 0,
+                    "name": "Schiphol",
+                    "via": None,
+                },
+                {
+                    "ident": "ARNEM",
+                    "type": "FIX",
+                    "lat": 52.01667,
+                    "lon": 5.9,
+                    "alt": 0,
+                    "name": None,
+                    "via": {"ident": "UL620", "type": "AWY-HI"},
+                },
+            ]
+        },
+    )
+    unchanged_plan = deepcopy(plan)
+
+    plan_dict = plan.to_api_dict()
+    # check that the plan was serialised for the API
+    assert plan_dict["createdAt"] == "2021-04-28T19:55:45.000Z"
+    assert plan_dict["user"]["joined"] == "2019-02-27T21:16:08.000Z"
+    assert plan_dict["route"]["nodes"][1]["via"] == {
+        "ident": "UL620",
+        "type": "AWY-HI",
+    }
+    # check that serialising it left the plan itself unchanged
+    assert plan == unchanged_plan
+    assert isinstance(plan.createdAt, datetime.datetime)
+    assert isinstance(plan.user, User)
+    assert isinstance(plan.route, Route)
+    assert isinstance(plan.route.nodes[1], RouteNode)
@@ -7,14 +7,12 @@ from dateutil.tz import tzutc
 import flightplandb
 from flightplandb.datatypes import Plan, User, UserSmall
 
-
-class AsyncIter:
-    def __init__(self, items):
-        self.items = items
-
-    async def __aiter__(self):
-        for item in self.items:
-            yield item
+# expected datetimes, built once rather than inside every test
+UTC = tzutc()
+BOT_JOINED = datetime.datetime(2020, 8, 6, 17, 4, 30, tzinfo=UTC)
+BOT_LAST_SEEN = datetime.datetime(2020, 12, 27, 12, 40, 6, tzinfo=UTC)
+LEMON_JOINED = datetime.datetime(2008, 12, 31, 15, 49, 18, tzinfo=UTC)
+LEMON_LAST_SEEN = datetime.datetime(2021, 4, 24, 0, 22, 46, tzinfo=UTC)
 
 
 # localhost is set on every test to allow async loops
@@ -39,8 +37,8 @@ async def test_self_info(patched_internal_get):
         username="discordflightplannerbot",
         location=None,
         gravatarHash="3bcb4f39a24700e081f49c3d2d43d277",
-        joined=datetime.datetime(2020, 8, 6, 17, 4, 30, tzinfo=tzutc()),
-        lastSeen=datetime.datetime(2020, 12, 27, 12, 40, 6, tzinfo=tzutc()),
+        joined=BOT_JOINED,
+        lastSeen=BOT_LAST_SEEN,
         plansCount=2,
         plansDistance=794.0094160460012,
         plansDownloads=0,
@@ -77,8 +75,8 @@ async def test_user_info(patched_internal_get):
         username="lemon",
         location="\U0001F601",
         gravatarHash="7889b0d4380a7194b6b67c8e2765289d",
-        joined=datetime.datetime(2008, 12, 31, 15, 49, 18, tzinfo=tzutc()),
-        lastSeen=datetime.datetime(2021, 4, 24, 0, 22, 46, tzinfo=tzutc()),
+        joined=LEMON_JOINED,
+        lastSeen=LEMON_LAST_SEEN,
         plansCount=479,
         plansDistance=1212799.2736187153,
         plansDownloads=10341,
@@ -96,7 +94,7 @@ async def test_user_info(patched_internal_get):
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
 @mock.patch("flightplandb.internal.getiter")
-async def test_user_plans(patched_internal_getiter):
+async def test_user_plans(patched_internal_getiter, async_iter):
     json_response = [
         {
             "id": 62373,
@@ -199,25 +197,20 @@ async def test_user_plans(patched_internal_getiter):
         ),
     ]
 
-    correct_calls = [
-        mock.call(path="/user/lemon/plans", limit=100, sort="created", key=None)
-    ]
-
-    patched_internal_getiter.return_value = AsyncIter(json_response)
+    patched_internal_getiter.return_value = async_iter(json_response)
 
     response = flightplandb.user.plans("lemon")
     # check that UserAPI method decoded data correctly for given response
-    response_list = []
-    async for i in response:
-        response_list.append(i)
-    assert response_list == correct_response_list
+    assert [i async for i in response] == correct_response_list
     # check that UserAPI method made correct request of FlightPlanDB
-    patched_internal_getiter.assert_has_calls(correct_calls)
+    patched_internal_getiter.assert_called_once_with(
+        path="/user/lemon/plans", limit=100, sort="created", key=None
+    )
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
 @mock.patch("flightplandb.internal.getiter")
-async def test_user_likes(patched_internal_getiter):
+async def test_user_likes(patched_internal_getiter, async_iter):
     json_response = [
         {
             "id": 62373,
@@ -320,25 +313,20 @@ async def test_user_likes(patched_internal_getiter):
         ),
     ]
 
-    correct_calls = [
-        mock.call(path="/user/lemon/likes", limit=100, sort="created", key=None)
-    ]
-
-    patched_internal_getiter.return_value = AsyncIter(json_response)
+    patched_internal_getiter.return_value = async_iter(json_response)
 
     response = flightplandb.user.likes("lemon")
     # check that UserAPI method decoded data correctly for given response
-    response_list = []
-    async for i in response:
-        response_list.append(i)
-    assert response_list == correct_response_list
+    assert [i async for i in response] == correct_response_list
     # check that UserAPI method made correct request of FlightPlanDB
-    patched_internal_getiter.assert_has_calls(correct_calls)
+    patched_internal_getiter.assert_called_once_with(
+        path="/user/lemon/likes", limit=100, sort="created", key=None
+    )
 
 
 @pytest.mark.allow_hosts(["127.0.0.1", "::1"])
 @mock.patch("flightplandb.internal.getiter")
-async def test_user_search(patched_internal_getiter):
+async def test_user_search(patched_internal_getiter, async_iter):
     json_response = [
         {
             "id": 1,
@@ -381,17 +369,12 @@ async def test_user_search(patched_internal_getiter):
         ),
     ]
 
-    correct_calls = [
-        mock.call(path="/search/users", limit=100, params={"q": "lemon"}, key=None)
-    ]
-
-    patched_internal_getiter.return_value = AsyncIter(json_response)
+    patched_internal_getiter.return_value = async_iter(json_response)
 
     response = flightplandb.user.search("lemon")
     # check that UserAPI method decoded data correctly for given response
-    response_list = []
-    async for i in response:
-        response_list.append(i)
-    assert response_list == correct_response_list
+    assert [i async for i in response] == correct_response_list
     # check that UserAPI method made correct request of FlightPlanDB
-    patched_internal_getiter.assert_has_calls(correct_calls)
+    patched_internal_getiter.assert_called_once_with(
+        path="/search/users", limit=100, params={"q": "lemon"}, key=None
+    )